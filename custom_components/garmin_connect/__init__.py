@@ -1,9 +1,16 @@
 """The Garmin Connect integration."""
 
 import asyncio
-from collections.abc import Awaitable
-from datetime import datetime, timedelta
+from bisect import bisect_right, insort
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import partial
 import logging
+import random
+import time
+from typing import Any
 from zoneinfo import ZoneInfo
 
 from garminconnect import (
@@ -12,77 +19,287 @@ from garminconnect import (
     GarminConnectConnectionError,
     GarminConnectTooManyRequestsError,
 )
+from garth.exc import GarthException, GarthHTTPError
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.const import CONF_PASSWORD, CONF_TOKEN, CONF_USERNAME
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady, IntegrationError
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from requests import RequestException
 
 from .const import (
+    ACTIVITY_TYPES_TTL,
+    BADGES_TTL,
     DATA_COORDINATOR,
     DAY_TO_NUMBER,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_RETRIES,
+    DEFAULT_RETRY_BACKOFF,
+    DEFAULT_RETRY_STATUSES,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
+    GEAR_DEFAULTS_MAX_AGE,
+    GEAR_DEFAULTS_TTL,
+    GEAR_STATS_CONCURRENCY,
+    GEAR_TTL,
     LEVEL_POINTS,
+    LOGIN_GRACE_PERIOD,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    UNSUPPORTED_RECHECK,
     Gear,
 )
+from .helpers import is_rate_limited, is_session_error, parse_retry_after, status_code
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = ["sensor"]
 
+_MIDNIGHT = datetime.min.time()
+
+# Sensor types fed by endpoints that are skipped while none of them is enabled
+_ALARM_TYPES = frozenset({"nextAlarm"})
+_SLEEP_TYPES = frozenset({"sleepScore", "sleepTimeSeconds"})
+_HRV_TYPES = frozenset({"hrvStatus"})
+
+_MINUTES_PER_DAY = 24 * 60
+_MINUTES_PER_WEEK = 7 * _MINUTES_PER_DAY
+# Minutes from the start of the week (Sunday midnight) to each alarm day
+_DAY_MINUTES = {day: number % 7 * _MINUTES_PER_DAY for day, number in DAY_TO_NUMBER.items()}
+
+
+async def _async_skip() -> dict:
+    """Stand in for an endpoint that is not fetched this update."""
+    return {}
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Garmin Connect from a config entry."""
 
     coordinator = GarminConnectDataUpdateCoordinator(hass, entry=entry)
+    entry.async_on_unload(partial(coordinator.executor.shutdown, wait=False))
+    entry.async_on_unload(coordinator.api.garth.sess.close)
 
     if not await coordinator.async_login():
         return False
 
+    await coordinator.async_load_stored_data()
     await coordinator.async_config_entry_first_refresh()
 
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = {DATA_COORDINATOR: coordinator}
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {DATA_COORDINATOR: coordinator}
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored data of a deleted config entry."""
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)[DATA_COORDINATOR]
+        await coordinator.async_save_stored_data()
     return unload_ok
 
 
 class GarminConnectDataUpdateCoordinator(DataUpdateCoordinator):
     """Garmin Connect Data Update Coordinator."""
 
+    __slots__ = (
+        "_cache",
+        "_gear_stats_key",
+        "_last_login",
+        "_rate_limited_until",
+        "_semaphore",
+        "_store",
+        "_stored_data",
+        "_today_cache",
+        "_unsupported",
+        "activity_type_ids",
+        "activity_type_keys",
+        "api",
+        "country",
+        "default_activities_by_uuid",
+        "enabled_types",
+        "entry",
+        "executor",
+        "gear_by_uuid",
+        "gear_stats_by_uuid",
+        "in_china",
+        "last_activities",
+        "time_zone",
+        "tz",
+    )
+
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the Garmin Connect hub."""
         self.entry = entry
         self.hass = hass
-        self.in_china = False
-
         self.country = self.hass.config.country
-        if self.country == "CN":
-            self.in_china = True
+        self.in_china = self.country == "CN"
         _LOGGER.debug("Country: %s", self.country)
 
         self.time_zone = self.hass.config.time_zone
+        self.tz = ZoneInfo(self.time_zone)
         _LOGGER.debug("Time zone: %s", self.time_zone)
 
         self.api = Garmin(entry.data[CONF_USERNAME], entry.data[CONF_PASSWORD], self.in_china)
+        self.api.garth.configure(
+            retries=DEFAULT_RETRIES,
+            status_forcelist=DEFAULT_RETRY_STATUSES,
+            backoff_factor=DEFAULT_RETRY_BACKOFF,
+            pool_connections=DEFAULT_POOL_SIZE,
+            pool_maxsize=DEFAULT_POOL_SIZE,
+        )
+
+        # Keep blocking Garmin requests off Home Assistant's shared executor
+        self.executor = ThreadPoolExecutor(
+            max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix=DOMAIN
+        )
+        # Bound in-flight requests so queued jobs do not count against their timeout
+        self._semaphore = asyncio.Semaphore(DEFAULT_MAX_WORKERS)
+        self._cache: dict[str, tuple[float, Any]] = {}
+        self._gear_stats_key: tuple | None = None
+        self._last_login = 0.0
+        self._rate_limited_until = 0.0
+        self._today_cache: tuple[date, str, str, str] | None = None
+        # Monotonic time at which an endpoint last returned no data for this account
+        self._unsupported: dict[str, float] = {}
+        self.activity_type_ids: dict[str, int] = {}
+        self.activity_type_keys: dict[int, str] = {}
+        self.gear_by_uuid: dict[str, dict] = {}
+        self.gear_stats_by_uuid: dict[str, dict] = {}
+        self.default_activities_by_uuid: dict[str, str] = {}
+        self.last_activities: list[dict] = []
+        # Sensor types of the entities currently added to Home Assistant
+        self.enabled_types: set[str] = set()
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}"
+        )
+        self._stored_data: dict[str, Any] | None = None
+
+        # Entities are only notified when the fetched payload differs from the last one
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=DEFAULT_UPDATE_INTERVAL,
+            always_update=False,
+        )
+
+    async def async_load_stored_data(self) -> None:
+        """Load the payload stored by the previous run."""
+        self._stored_data = await self._store.async_load()
+
+    async def async_save_stored_data(self) -> None:
+        """Write a pending delayed save now, so it cannot outlive the entry."""
+        if self._stored_data:
+            await self._store.async_save(self._stored_data)
+
+    @callback
+    def _data_to_store(self) -> dict[str, Any] | None:
+        """Return the payload to persist."""
+        return self._stored_data
+
+    def async_add_executor_job(self, target: Callable, *args) -> asyncio.Future:
+        """Run a blocking Garmin Connect call in the integration executor."""
+        return self.hass.loop.run_in_executor(self.executor, target, *args)
+
+    async def async_call(self, target: Callable, *args):
+        """Run a Garmin Connect request, logging in again once if the session was rejected."""
+        try:
+            return await self.async_add_executor_job(target, *args)
+        except (GarminConnectAuthenticationError, GarthHTTPError) as err:
+            # Only a rejected request is safe to send again, a connection error may hide a
+            # write that reached Garmin Connect
+            if isinstance(err, GarthHTTPError) and status_code(err) != 401:
+                raise
+            if not await self.async_login():
+                raise IntegrationError("Failed to login to Garmin Connect, unable to update")
+            return await self.async_add_executor_job(target, *args)
+
+    async def _async_fetch(self, target: Callable, *args):
+        """Fetch data from Garmin Connect, giving up after DEFAULT_REQUEST_TIMEOUT."""
+        async with self._semaphore:
+            return await asyncio.wait_for(
+                self.async_add_executor_job(target, *args), DEFAULT_REQUEST_TIMEOUT
+            )
 
-        super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=DEFAULT_UPDATE_INTERVAL)
+    async def _async_fetch_cached(self, key: str, ttl: timedelta, target: Callable, *args):
+        """Fetch data from Garmin Connect, reusing the cached value until its TTL expires."""
+        return await self._async_cached(key, ttl, self._async_fetch, target, *args)
+
+    async def _async_cached(self, key: str, ttl: timedelta, fetch: Callable[..., Awaitable], *args):
+        """Await fetch, reusing the cached result until its TTL expires or the fetch fails."""
+        if (cached := self._cache.get(key)) and time.monotonic() - cached[0] < ttl.total_seconds():
+            return cached[1]
+
+        try:
+            value = await fetch(*args)
+        except (
+            GarminConnectConnectionError,
+            GarminConnectTooManyRequestsError,
+            GarthHTTPError,
+            TimeoutError,
+        ) as err:
+            if cached is None or (isinstance(err, GarthHTTPError) and not is_rate_limited(err)):
+                raise
+            _LOGGER.debug("Keeping the cached %s after a failed request: %s", key, err)
+            return cached[1]
+        self._cache[key] = (time.monotonic(), value)
+        return value
+
+    async def _async_fetch_gear_stats(self, gear: list) -> list:
+        """Fetch the statistics of all gear items, a few at a time."""
+        semaphore = asyncio.Semaphore(GEAR_STATS_CONCURRENCY)
+
+        async def _async_fetch_one(uuid: str) -> dict:
+            async with semaphore:
+                return await self._async_fetch(self.api.get_gear_stats, uuid)
+
+        tasks: list[Awaitable] = [_async_fetch_one(gear_item[Gear.UUID]) for gear_item in gear]
+        return await asyncio.gather(*tasks)
+
+    async def async_get_gear_defaults(self) -> list:
+        """Return the gear defaults, fetching them unless the cached copy is recent."""
+        return await self._async_cached(
+            "gear_defaults",
+            GEAR_DEFAULTS_MAX_AGE,
+            self.async_call,
+            self.api.get_gear_defaults,
+            self.data[Gear.USERPROFILE_ID],
+        )
+
+    def invalidate_cache(self, key: str) -> None:
+        """Drop a cached endpoint so the next update fetches it again."""
+        self._cache.pop(key, None)
+
+    def _login(self, token: str | None) -> None:
+        """Login to Garmin Connect, resuming the stored session when possible."""
+        if token:
+            try:
+                self.api.login(token)
+                return
+            except (GarminConnectAuthenticationError, GarthHTTPError) as err:
+                # Rate limits and connection errors are not helped by a password login
+                if isinstance(err, GarthHTTPError) and status_code(err) != 401:
+                    raise
+                _LOGGER.debug("Stored Garmin Connect session could not be resumed: %s", err)
+
+        self.api.login()
 
     async def async_login(self) -> bool:
         """Login to Garmin Connect."""
         try:
-            await self.hass.async_add_executor_job(self.api.login)
+            await self.async_add_executor_job(self._login, self.entry.data.get(CONF_TOKEN))
         except (
             GarminConnectAuthenticationError,
             GarminConnectTooManyRequestsError,
@@ -96,157 +313,333 @@ class GarminConnectDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.exception("Unknown error occurred during Garmin Connect login request")
             return False
 
+        self._last_login = time.monotonic()
+        self._async_save_token()
         return True
 
-    async def _async_update_data(self) -> dict:
-        """Fetch data from Garmin Connect."""
-        summary = {}
-        body = {}
-        alarms = {}
-        gear = {}
-        gear_stats = {}
-        gear_defaults = {}
-        activity_types = {}
-        last_activities = []
-        sleep_data = {}
-        sleep_score = None
-        sleep_time_seconds = None
-        hrv_data = {}
-        hrv_status = {"status": "unknown"}
-        next_alarms = []
-
-        today = datetime.now(ZoneInfo(self.time_zone)).date()
-
-        try:
-            # User summary
-            summary = await self.hass.async_add_executor_job(
-                self.api.get_user_summary, today.isoformat()
+    @callback
+    def _async_save_token(self) -> None:
+        """Persist the Garth session so a restart can skip the SSO handshake."""
+        if (token := self.api.garth.dumps()) != self.entry.data.get(CONF_TOKEN):
+            self.hass.config_entries.async_update_entry(
+                self.entry, data={**self.entry.data, CONF_TOKEN: token}
             )
-            _LOGGER.debug("Summary data fetched: %s", summary)
 
-            # Body composition
-            body = await self.hass.async_add_executor_job(
-                self.api.get_body_composition, today.isoformat()
+    async def _async_refresh_token(self) -> None:
+        """Refresh an expired OAuth2 token once, before the concurrent requests race to do so."""
+        if not getattr(self.api.garth.oauth2_token, "expired", False):
+            return
+        try:
+            await self.async_add_executor_job(self.api.garth.refresh_oauth2)
+        except (GarthException, RequestException) as err:
+            # The requests then fail on the session and trigger a relogin
+            _LOGGER.debug("Garmin Connect OAuth2 token could not be refreshed: %s", err)
+
+    async def _async_fetch_all(
+        self, requests: list[Callable[[], Awaitable]], results: list | None = None
+    ) -> list:
+        """Run the requests concurrently, or only those that failed on the session again."""
+        if results is None:
+            return await asyncio.gather(
+                *(request() for request in requests), return_exceptions=True
             )
-            _LOGGER.debug("Body data fetched: %s", body)
 
-            # Last activities
-            last_activities = await self.hass.async_add_executor_job(
-                self.api.get_activities_by_date,
+        failed = [index for index, result in enumerate(results) if is_session_error(result)]
+        retried = await asyncio.gather(
+            *(requests[index]() for index in failed), return_exceptions=True
+        )
+        results = list(results)
+        for index, result in zip(failed, retried):
+            results[index] = result
+        return results
+
+    def _is_enabled(self, sensor_types: frozenset[str]) -> bool:
+        """Return whether an optional endpoint feeds any enabled entity."""
+        # Entities register after the first refresh, which therefore fetches everything
+        return self.data is None or not self.enabled_types.isdisjoint(sensor_types)
+
+    def _is_supported(self, endpoint: str) -> bool:
+        """Return whether an endpoint is worth requesting for this account."""
+        marked = self._unsupported.get(endpoint)
+        return marked is None or time.monotonic() - marked >= UNSUPPORTED_RECHECK.total_seconds()
+
+    def _today_strings(self, today: date) -> tuple[date, str, str, str]:
+        """Return today and the ISO dates used by the requests, cached until the date rolls."""
+        if self._today_cache is None or self._today_cache[0] != today:
+            self._today_cache = (
+                today,
+                today.isoformat(),
                 (today - timedelta(days=7)).isoformat(),
                 (today + timedelta(days=1)).isoformat(),
             )
-            _LOGGER.debug("Activities data fetched: %s", last_activities)
-            summary["lastActivities"] = last_activities
-            summary["lastActivity"] = last_activities[0] if last_activities else {}
-
-            # Badges
-            badges = await self.hass.async_add_executor_job(self.api.get_earned_badges)
-            _LOGGER.debug("Badges data fetched: %s", badges)
-            summary["badges"] = badges
-
-            # Calculate user points and user level
-            user_points = 0
-            for badge in badges:
-                user_points += badge["badgePoints"] * badge["badgeEarnedNumber"]
-
-            summary["userPoints"] = user_points
-
-            user_level = 0
-            for level, points in LEVEL_POINTS.items():
-                if user_points >= points:
-                    user_level = level
-
-            summary["userLevel"] = user_level
-
-            # Alarms
-            alarms = await self.hass.async_add_executor_job(self.api.get_device_alarms)
-            _LOGGER.debug("Alarms data fetched: %s", alarms)
+        return self._today_cache
 
-            next_alarms = calculate_next_active_alarms(alarms, self.time_zone)
-
-            # Activity types
-            activity_types = await self.hass.async_add_executor_job(self.api.get_activity_types)
-            _LOGGER.debug("Activity types data fetched: %s", activity_types)
+    async def _async_update_data(self) -> dict:
+        """Fetch data from Garmin Connect."""
+        if (
+            self.data is None
+            and self._stored_data
+            and time.time() - self._stored_data["saved"] < DEFAULT_UPDATE_INTERVAL.total_seconds()
+        ):
+            # Restarted within one update interval, the stored payload is still current
+            _LOGGER.debug("Using stored Garmin Connect data")
+            return self._restore_stored_data()
+
+        if time.monotonic() < self._rate_limited_until:
+            if stale_data := self._stale_data():
+                _LOGGER.debug("Garmin Connect rate limit in effect, keeping the last data")
+                return stale_data
+            raise UpdateFailed("Garmin Connect rate limit in effect")
 
-            # Sleep data
-            sleep_data = await self.hass.async_add_executor_job(
-                self.api.get_sleep_data, today.isoformat()
-            )
-            _LOGGER.debug("Sleep data fetched: %s", sleep_data)
+        gear = {}
+        gear_stats = {}
+        gear_defaults = {}
+        hrv_status = {"status": "unknown"}
 
-            # HRV data
-            hrv_data = await self.hass.async_add_executor_job(
-                self.api.get_hrv_data, today.isoformat()
-            )
-            _LOGGER.debug("HRV data fetched: %s", hrv_data)
-        except (
-            GarminConnectAuthenticationError,
-            GarminConnectTooManyRequestsError,
-            GarminConnectConnectionError,
-        ) as error:
+        api = self.api
+        fetch = self._async_fetch
+        fetch_cached = self._async_fetch_cached
+
+        # One clock reading serves the request dates and the alarm calculation
+        now = datetime.now(self.tz)
+        _, today_iso, week_ago_iso, tomorrow_iso = self._today_strings(now.date())
+
+        # Independent endpoints are fetched concurrently
+        requests: list[Callable[[], Awaitable]] = [
+            partial(fetch, api.get_user_summary, today_iso),
+            partial(fetch, api.get_body_composition, today_iso),
+            partial(fetch, api.get_activities_by_date, week_ago_iso, tomorrow_iso),
+            partial(fetch_cached, "badges", BADGES_TTL, api.get_earned_badges),
+            (
+                partial(fetch, api.get_device_alarms)
+                if self._is_enabled(_ALARM_TYPES)
+                else _async_skip
+            ),
+            partial(fetch_cached, "activity_types", ACTIVITY_TYPES_TTL, api.get_activity_types),
+            (
+                partial(fetch, api.get_sleep_data, today_iso)
+                if self._is_enabled(_SLEEP_TYPES)
+                else _async_skip
+            ),
+            (
+                partial(fetch, api.get_hrv_data, today_iso)
+                if self._is_enabled(_HRV_TYPES) and self._is_supported("hrv")
+                else _async_skip
+            ),
+        ]
+        await self._async_refresh_token()
+        results = await self._async_fetch_all(requests)
+
+        if session_error := next((result for result in results if is_session_error(result)), None):
+            if time.monotonic() - self._last_login < LOGIN_GRACE_PERIOD.total_seconds():
+                raise UpdateFailed(session_error) from session_error
             _LOGGER.debug("Trying to relogin to Garmin Connect")
             if not await self.async_login():
-                raise UpdateFailed(error) from error
+                raise UpdateFailed(session_error) from session_error
+            results = await self._async_fetch_all(requests, results)
+
+        for result in results:
+            if is_rate_limited(result):
+                retry_after = parse_retry_after(result)
+                self._rate_limited_until = (
+                    time.monotonic() + retry_after + random.uniform(0, retry_after * 0.1)
+                )
+                if stale_data := self._stale_data():
+                    _LOGGER.debug("Garmin Connect rate limit reached, keeping the last data")
+                    return stale_data
+                raise UpdateFailed(result) from result
+            if is_session_error(result):
+                raise UpdateFailed(result) from result
+            if isinstance(result, TimeoutError):
+                _LOGGER.debug("Garmin Connect request timed out, keeping its last data")
+            elif isinstance(result, BaseException):
+                raise result
+
+        (
+            summary,
+            body,
+            last_activities,
+            badges,
+            alarms,
+            activity_types,
+            sleep_data,
+            hrv_data,
+        ) = results
+
+        if isinstance(summary, TimeoutError):
+            raise UpdateFailed("Garmin Connect request timed out") from summary
+
+        # Timed out endpoints keep their values from the last payload, or fall back to empty
+        # values without one, and such an incomplete payload is not stored
+        incomplete = any(isinstance(result, TimeoutError) for result in results)
+        previous = (self._stale_data() or {}) if incomplete else {}
+        body_timed_out = isinstance(body, TimeoutError)
+        if body_timed_out:
+            body = {}
+        if isinstance(last_activities, TimeoutError):
+            last_activities = self.last_activities
+        if isinstance(badges, TimeoutError):
+            badges = previous.get("badges", [])
+        if isinstance(activity_types, TimeoutError):
+            activity_types = previous.get("activityTypes", [])
+
+        _LOGGER.debug("Summary data fetched: %s", summary)
+        _LOGGER.debug("Body data fetched: %s", body)
+        _LOGGER.debug("Activities data fetched: %s", last_activities)
+        _LOGGER.debug("Badges data fetched: %s", badges)
+        _LOGGER.debug("Alarms data fetched: %s", alarms)
+        _LOGGER.debug("Activity types data fetched: %s", activity_types)
+        _LOGGER.debug("Sleep data fetched: %s", sleep_data)
+        _LOGGER.debug("HRV data fetched: %s", hrv_data)
+
+        # The full activities are kept off the payload, which only tracks their ids
+        self.last_activities = last_activities
+        summary["lastActivities"] = [activity.get("activityId") for activity in last_activities]
+        summary["lastActivity"] = last_activities[0] if last_activities else {}
+        summary["badges"] = badges
+
+        # Calculate user points and user level
+        user_points = sum(badge["badgePoints"] * badge["badgeEarnedNumber"] for badge in badges)
+        summary["userPoints"] = user_points
+
+        summary["userLevel"] = bisect_right(LEVEL_POINTS, user_points)
+
+        if isinstance(alarms, TimeoutError):
+            next_alarms = previous.get("nextAlarm", [])
+        else:
+            next_alarms = calculate_next_active_alarms(alarms, now)
 
         # Gear data
-        try:
-            gear = await self.hass.async_add_executor_job(
-                self.api.get_gear, summary[Gear.USERPROFILE_ID]
-            )
-            _LOGGER.debug("Gear data fetched: %s", gear)
-
-            tasks: list[Awaitable] = [
-                self.hass.async_add_executor_job(self.api.get_gear_stats, gear_item[Gear.UUID])
-                for gear_item in gear
-            ]
-            gear_stats = await asyncio.gather(*tasks)
-            _LOGGER.debug("Gear stats data fetched: %s", gear_stats)
-
-            gear_defaults = await self.hass.async_add_executor_job(
-                self.api.get_gear_defaults, summary[Gear.USERPROFILE_ID]
-            )
-            _LOGGER.debug("Gear defaults data fetched: %s", gear_defaults)
-        except (KeyError, TypeError, ValueError, ConnectionError) as err:
-            _LOGGER.debug("Gear data is not available: %s", err)
-
-        # Sleep score data
-        try:
-            sleep_score = sleep_data["dailySleepDTO"]["sleepScores"]["overall"]["value"]
-            _LOGGER.debug("Sleep score data: %s", sleep_score)
-        except KeyError:
-            _LOGGER.debug("Sleep score data is not available")
-
-        # Sleep time seconds data
-        try:
-            sleep_time_seconds = sleep_data["dailySleepDTO"]["sleepTimeSeconds"]
-            _LOGGER.debug("Sleep time seconds data: %s", sleep_time_seconds)
-        except KeyError:
-            _LOGGER.debug("Sleep time seconds data is not available")
+        if user_profile_id := summary.get(Gear.USERPROFILE_ID):
+            try:
+                gear, gear_defaults = await asyncio.gather(
+                    fetch_cached("gear", GEAR_TTL, api.get_gear, user_profile_id),
+                    fetch_cached(
+                        "gear_defaults",
+                        GEAR_DEFAULTS_TTL,
+                        api.get_gear_defaults,
+                        user_profile_id,
+                    ),
+                )
+                _LOGGER.debug("Gear data fetched: %s", gear)
+                _LOGGER.debug("Gear defaults data fetched: %s", gear_defaults)
 
-        # HRV data
-        try:
-            if hrv_data and "hrvSummary" in hrv_data:
+                # Cumulative gear statistics only change when an activity is recorded
+                gear_stats_key = (
+                    summary["lastActivity"].get("activityId"),
+                    tuple(gear_item[Gear.UUID] for gear_item in gear),
+                )
+                if gear_stats_key != self._gear_stats_key:
+                    self.invalidate_cache("gear_stats")
+                    self._gear_stats_key = gear_stats_key
+
+                if gear:
+                    gear_stats = await self._async_cached(
+                        "gear_stats", GEAR_TTL, self._async_fetch_gear_stats, gear
+                    )
+                    _LOGGER.debug("Gear stats data fetched: %s", gear_stats)
+            except (GarminConnectTooManyRequestsError, GarthHTTPError, TimeoutError) as err:
+                if isinstance(err, GarthHTTPError) and not is_rate_limited(err):
+                    raise
+                _LOGGER.debug("Gear data could not be fetched, keeping the last data: %s", err)
+                incomplete = True
+                last_data = self.data or {}
+                gear = last_data.get("gear", {})
+                gear_stats = last_data.get("gearStats", {})
+                gear_defaults = last_data.get("gearDefaults", {})
+            except (KeyError, TypeError, ValueError, ConnectionError) as err:
+                _LOGGER.debug("Gear data is not available: %s", err)
+
+        # Sleep data
+        if isinstance(sleep_data, TimeoutError):
+            sleep_score = previous.get("sleepScore")
+            sleep_time_seconds = previous.get("sleepTimeSeconds")
+        else:
+            sleep_dto = sleep_data.get("dailySleepDTO") or {}
+            sleep_score = ((sleep_dto.get("sleepScores") or {}).get("overall") or {}).get("value")
+            sleep_time_seconds = sleep_dto.get("sleepTimeSeconds")
+        _LOGGER.debug("Sleep score data: %s", sleep_score)
+        _LOGGER.debug("Sleep time seconds data: %s", sleep_time_seconds)
+
+        # HRV data, which is None for devices without HRV tracking
+        if isinstance(hrv_data, TimeoutError):
+            hrv_status = previous.get("hrvStatus", hrv_status)
+        elif hrv_data is None:
+            self._unsupported["hrv"] = time.monotonic()
+        elif hrv_data:
+            self._unsupported.pop("hrv", None)
+            if "hrvSummary" in hrv_data:
                 hrv_status = hrv_data["hrvSummary"]
                 _LOGGER.debug("HRV summary: %s", hrv_status)
-        except KeyError:
-            _LOGGER.debug("HRV data is not available")
-
-        return {
-            **summary,
-            **body["totalAverage"],
-            "nextAlarm": next_alarms,
-            "gear": gear,
-            "gearStats": gear_stats,
-            "activityTypes": activity_types,
-            "gearDefaults": gear_defaults,
-            "sleepScore": sleep_score,
-            "sleepTimeSeconds": sleep_time_seconds,
-            "hrvStatus": hrv_status,
+
+        # Garth refreshes the OAuth2 token transparently while fetching
+        self._async_save_token()
+
+        # The summary is fetched fresh every update, so it is extended in place
+        data = summary
+        data.update(body.get("totalAverage") or {})
+        data["nextAlarm"] = next_alarms
+        data["gear"] = gear
+        data["gearStats"] = gear_stats
+        data["activityTypes"] = activity_types
+        data["gearDefaults"] = gear_defaults
+        data["sleepScore"] = sleep_score
+        data["sleepTimeSeconds"] = sleep_time_seconds
+        data["hrvStatus"] = hrv_status
+        if body_timed_out:
+            for key, value in previous.items():
+                data.setdefault(key, value)
+
+        self._index_data(data)
+        if not incomplete:
+            self._stored_data = {
+                "saved": time.time(),
+                "data": data,
+                "lastActivities": last_activities,
+            }
+            self._store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY.total_seconds())
+        return data
+
+    def _stale_data(self) -> dict | None:
+        """Return the last known payload, if there is one."""
+        if self.data:
+            return self.data
+        if self._stored_data:
+            return self._restore_stored_data()
+        return None
+
+    def _restore_stored_data(self) -> dict:
+        """Return the stored payload and rebuild the state derived from it."""
+        self.last_activities = self._stored_data.get("lastActivities", [])
+        self._index_data(self._stored_data["data"])
+        return self._stored_data["data"]
+
+    def _index_data(self, data: dict) -> None:
+        """Build the lookup tables derived from a payload."""
+        self.activity_type_ids = {
+            activity_type[Gear.TYPE_KEY]: activity_type[Gear.TYPE_ID]
+            for activity_type in data["activityTypes"]
+        }
+        self.activity_type_keys = {
+            type_id: type_key for type_key, type_id in self.activity_type_ids.items()
+        }
+        self.gear_by_uuid = {gear_item[Gear.UUID]: gear_item for gear_item in data["gear"]}
+        self.gear_stats_by_uuid = {
+            gear_stats_item[Gear.UUID]: gear_stats_item for gear_stats_item in data["gearStats"]
+        }
+        # Activity types each gear item is the default for, as shown by the gear sensors
+        default_activities = defaultdict(list)
+        for gear_default in data["gearDefaults"]:
+            if gear_default["defaultGear"] is True and (
+                type_key := self.activity_type_keys.get(gear_default[Gear.ACTIVITY_TYPE_PK])
+            ):
+                default_activities[gear_default[Gear.UUID]].append(type_key)
+        self.default_activities_by_uuid = {
+            uuid: ", ".join(sorted(type_keys)) for uuid, type_keys in default_activities.items()
         }
 
 
-def calculate_next_active_alarms(alarms, time_zone):
+def calculate_next_active_alarms(alarms, now: datetime) -> list[str]:
     """
     Calculate garmin next active alarms from settings.
     Alarms are sorted by time.
@@ -254,43 +647,36 @@ def calculate_next_active_alarms(alarms, time_zone):
     Example of alarms data:
     Alarms data fetched: [{'alarmMode': 'OFF', 'alarmTime': 1233, 'alarmDays': ['ONCE'], 'alarmSound': 'TONE_AND_VIBRATION', 'alarmId': 1737308355, 'changeState': 'UNCHANGED', 'backlight': 'ON', 'enabled': None, 'alarmMessage': None, 'alarmImageId': None, 'alarmIcon': None, 'alarmType': None}]
     """
-    active_alarms = []
-    now = datetime.now(ZoneInfo(time_zone))
-    _LOGGER.debug("Now: %s, Alarms: %s", now, alarms)
+    active_alarms: list[str] = []
+
+    # Alarm times are handled as minutes since the start of the week (Sunday midnight)
+    today = now.date()
+    week_day = today.isoweekday() % 7
+    start_of_week = datetime.combine(today - timedelta(days=week_day), _MIDNIGHT, tzinfo=now.tzinfo)
+    today_minute = week_day * _MINUTES_PER_DAY
+    now_minute = today_minute + now.hour * 60 + now.minute
 
     for alarm_setting in alarms:
         if alarm_setting["alarmMode"] != "ON":
             continue
 
+        alarm_time = alarm_setting["alarmTime"]
         for day in alarm_setting["alarmDays"]:
-            alarm_time = alarm_setting["alarmTime"]
-            _LOGGER.debug("Alarm time: %s, Alarm day: %s", alarm_time, day)
             if day == "ONCE":
-                midnight = datetime.combine(
-                    now.date(), datetime.min.time(), tzinfo=ZoneInfo(time_zone)
-                )
-
-                alarm = midnight + timedelta(minutes=alarm_time)
-                _LOGGER.debug("Midnight: %s, Alarm: %s", midnight, alarm_time)
+                alarm_minute = today_minute + alarm_time
 
                 # If the alarm time is in the past, move it to the next day
-                if alarm < now:
-                    alarm += timedelta(days=1)
+                if alarm_minute <= now_minute:
+                    alarm_minute += _MINUTES_PER_DAY
             else:
-                start_of_week = datetime.combine(
-                    now.date() - timedelta(days=now.date().isoweekday() % 7),
-                    datetime.min.time(),
-                    tzinfo=ZoneInfo(time_zone),
-                )
-
-                days_to_add = DAY_TO_NUMBER[day] % 7
-                alarm = start_of_week + timedelta(minutes=alarm_time, days=days_to_add)
-                _LOGGER.debug("Start of week: %s, Alarm: %s", start_of_week, alarm)
+                alarm_minute = _DAY_MINUTES[day] + alarm_time
 
                 # If the alarm time is in the past, move it to the next week
-                if alarm < now:
-                    alarm += timedelta(days=7)
+                if alarm_minute <= now_minute:
+                    alarm_minute += _MINUTES_PER_WEEK
 
-            active_alarms.append(alarm.isoformat())
+            alarm = start_of_week + timedelta(minutes=alarm_minute)
+            # ISO 8601 strings in one time zone sort chronologically
+            insort(active_alarms, alarm.isoformat())
 
-    return sorted(active_alarms) if active_alarms else None
+    return active_alarms
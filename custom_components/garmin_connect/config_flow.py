@@ -1,6 +1,8 @@
 """Config flow for Garmin Connect integration."""
 
+import asyncio
 import logging
+import random
 
 from garminconnect import (
     Garmin,
@@ -8,30 +10,71 @@ from garminconnect import (
     GarminConnectConnectionError,
     GarminConnectTooManyRequestsError,
 )
+from garth.exc import GarthHTTPError
 from homeassistant import config_entries
-from homeassistant.const import CONF_ID, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.const import CONF_ID, CONF_PASSWORD, CONF_TOKEN, CONF_USERNAME
 import voluptuous as vol
 
-from .const import DOMAIN
+from .const import DOMAIN, LOGIN_MAX_ATTEMPTS, LOGIN_MAX_BACKOFF, LOGIN_MAX_WAIT
+from .helpers import parse_retry_after, status_code
 
 _LOGGER = logging.getLogger(__name__)
 
+# Config flow errors for HTTP failures raised by Garth during login
+_HTTP_STATUS_ERRORS = {401: "invalid_auth", 403: "invalid_auth", 429: "too_many_requests"}
+
+
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {vol.Required(CONF_USERNAME): str, vol.Required(CONF_PASSWORD): str}
+)
+
 
 class GarminConnectConfigFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Garmin Connect."""
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the Garmin Connect config flow."""
+        self._api: Garmin | None = None
+        self._api_credentials: tuple[str, str] | None = None
+
+    def _get_api(self, username: str, password: str) -> Garmin:
+        """Return the Garmin client, reusing it while the credentials are unchanged."""
+        if self._api is None or self._api_credentials != (username, password):
+            self._api = Garmin(username, password, self.hass.config.country == "CN")
+            self._api_credentials = (username, password)
+        return self._api
+
     async def _show_setup_form(self, errors=None):
         """Show the setup form to the user."""
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {vol.Required(CONF_USERNAME): str, vol.Required(CONF_PASSWORD): str}
-            ),
+            data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors or {},
         )
 
+    async def _async_login(self, api: Garmin) -> None:
+        """Login to Garmin Connect, backing off when rate limited."""
+        waited = 0.0
+        for attempt in range(LOGIN_MAX_ATTEMPTS):
+            try:
+                await self.hass.async_add_executor_job(api.login)
+                return
+            except (GarminConnectTooManyRequestsError, GarthHTTPError) as err:
+                # Garth rate limit errors escape login unwrapped on garminconnect 0.2.24
+                if isinstance(err, GarthHTTPError) and status_code(err) != 429:
+                    raise
+                delay = parse_retry_after(err, None)
+                if delay is None:
+                    delay = min(LOGIN_MAX_BACKOFF, 2**attempt) * random.uniform(0.5, 1.0)
+                # The form reports the rate limit rather than keep the user waiting
+                if attempt == LOGIN_MAX_ATTEMPTS - 1 or waited + delay > LOGIN_MAX_WAIT:
+                    raise
+                waited += delay
+                _LOGGER.debug("Garmin Connect login rate limited, retrying in %.1f s", delay)
+                await asyncio.sleep(delay)
+
     async def async_step_user(self, user_input=None):
         """Handle the initial step."""
         if user_input is None:
@@ -40,11 +83,11 @@ class GarminConnectConfigFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         username = user_input[CONF_USERNAME]
         password = user_input[CONF_PASSWORD]
 
-        api = Garmin(username, password)
+        api = self._get_api(username, password)
 
         errors = {}
         try:
-            await self.hass.async_add_executor_job(api.login)
+            await self._async_login(api)
         except GarminConnectConnectionError:
             errors["base"] = "cannot_connect"
             return await self._show_setup_form(errors)
@@ -54,6 +97,9 @@ class GarminConnectConfigFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         except GarminConnectTooManyRequestsError:
             errors["base"] = "too_many_requests"
             return await self._show_setup_form(errors)
+        except GarthHTTPError as err:
+            errors["base"] = _HTTP_STATUS_ERRORS.get(status_code(err), "cannot_connect")
+            return await self._show_setup_form(errors)
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception("Unexpected exception")
             errors["base"] = "unknown"
@@ -68,5 +114,7 @@ class GarminConnectConfigFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 CONF_ID: username,
                 CONF_USERNAME: username,
                 CONF_PASSWORD: password,
+                # Lets the first setup resume this session instead of logging in again
+                CONF_TOKEN: api.garth.dumps(),
             },
         )
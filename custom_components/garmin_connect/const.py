@@ -1,6 +1,7 @@
 """Constants for the Garmin Connect integration."""
 
 from datetime import timedelta
+from types import MappingProxyType
 from typing import NamedTuple
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
@@ -10,31 +11,61 @@ DOMAIN = "garmin_connect"
 DATA_COORDINATOR = "coordinator"
 DEFAULT_UPDATE_INTERVAL = timedelta(minutes=5)
 
-DAY_TO_NUMBER = {
-    "Mo": 1,
-    "M": 1,
-    "Tu": 2,
-    "We": 3,
-    "W": 3,
-    "Th": 4,
-    "Fr": 5,
-    "F": 5,
-    "Sa": 6,
-    "Su": 7,
-}
+# Last fetched payload, kept across restarts and served while rate limited
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = timedelta(minutes=1)
 
-LEVEL_POINTS = {
-    1: 0,
-    2: 20,
-    3: 60,
-    4: 140,
-    5: 300,
-    6: 620,
-    7: 1260,
-    8: 2540,
-    9: 5100,
-    10: 10220,
-}
+# Sized to the concurrent fetches of one update cycle so pooled connections are reused
+DEFAULT_POOL_SIZE = 32
+# Transient gateway errors are retried by the HTTP adapter before surfacing
+DEFAULT_RETRIES = 2
+DEFAULT_RETRY_BACKOFF = 0.3
+DEFAULT_RETRY_STATUSES = (502, 503, 504)
+# Seconds to back off after a rate limit that did not send a Retry-After header
+DEFAULT_RETRY_AFTER = 60
+# Worker threads dedicated to blocking Garmin Connect requests
+DEFAULT_MAX_WORKERS = 8
+# Seconds before a single Garmin Connect request is abandoned
+DEFAULT_REQUEST_TIMEOUT = 15
+# A failing update does not log in again within this period of a successful login
+LOGIN_GRACE_PERIOD = timedelta(minutes=1)
+# Rate-limited logins are retried after Retry-After, or with exponential backoff and jitter,
+# until the total wait (seconds) would exceed LOGIN_MAX_WAIT
+LOGIN_MAX_ATTEMPTS = 4
+LOGIN_MAX_BACKOFF = 4
+LOGIN_MAX_WAIT = 10
+
+# Quasi-static endpoints are fetched at most once per TTL
+ACTIVITY_TYPES_TTL = timedelta(days=1)
+BADGES_TTL = timedelta(hours=1)
+GEAR_TTL = timedelta(hours=6)
+GEAR_DEFAULTS_TTL = timedelta(days=1)
+# Gear defaults younger than this are reused by the set_active_gear service
+GEAR_DEFAULTS_MAX_AGE = timedelta(minutes=1)
+# Endpoints that returned nothing for the account are requested again after this period
+UNSUPPORTED_RECHECK = timedelta(hours=1)
+# Gear statistics are requested one per item, this many at a time
+GEAR_STATS_CONCURRENCY = 4
+# Gear defaults replaced by the set_active_gear service are cleared this many at a time
+GEAR_DEFAULTS_CONCURRENCY = 3
+
+DAY_TO_NUMBER = MappingProxyType(
+    {
+        "Mo": 1,
+        "M": 1,
+        "Tu": 2,
+        "We": 3,
+        "W": 3,
+        "Th": 4,
+        "Fr": 5,
+        "F": 5,
+        "Sa": 6,
+        "Su": 7,
+    }
+)
+
+# Points needed to reach each user level, starting at level 1
+LEVEL_POINTS = (0, 20, 60, 140, 300, 620, 1260, 2540, 5100, 10220)
 
 GARMIN_ENTITY_LIST = {
     "totalSteps": ["Total Steps", "steps", "mdi:walk", None, SensorStateClass.TOTAL, True],
@@ -659,12 +690,14 @@ GARMIN_ENTITY_LIST = {
     ],
 }
 
-GEAR_ICONS = {
-    "Shoes": "mdi:shoe-sneaker",
-    "Bike": "mdi:bike",
-    "Other": "mdi:basketball",
-    "Golf Clubs": "mdi:golf",
-}
+GEAR_ICONS = MappingProxyType(
+    {
+        "Shoes": "mdi:shoe-sneaker",
+        "Bike": "mdi:bike",
+        "Other": "mdi:basketball",
+        "Golf Clubs": "mdi:golf",
+    }
+)
 
 
 class ServiceSetting(NamedTuple):
@@ -0,0 +1,42 @@
+"""Helpers shared by the Garmin Connect coordinator and config flow."""
+
+from garminconnect import (
+    GarminConnectAuthenticationError,
+    GarminConnectConnectionError,
+    GarminConnectTooManyRequestsError,
+)
+from garth.exc import GarthHTTPError
+
+from .const import DEFAULT_RETRY_AFTER
+
+
+def status_code(err: BaseException) -> int | None:
+    """Return the HTTP status code behind a Garth error."""
+    if not isinstance(err, GarthHTTPError):
+        return None
+    return getattr(getattr(err.error, "response", None), "status_code", None)
+
+
+def is_rate_limited(err: BaseException) -> bool:
+    """Return whether an error is a rate limit, wrapped or raised raw by Garth."""
+    return isinstance(err, GarminConnectTooManyRequestsError) or status_code(err) == 429
+
+
+def is_session_error(err: BaseException) -> bool:
+    """Return whether an error is solved by renewing the session."""
+    return (
+        isinstance(err, (GarminConnectAuthenticationError, GarminConnectConnectionError))
+        or status_code(err) == 401
+    )
+
+
+def parse_retry_after(
+    err: BaseException, default: float | None = DEFAULT_RETRY_AFTER
+) -> float | None:
+    """Return the seconds to wait from the Retry-After header behind a rate limit error."""
+    source = err if isinstance(err, GarthHTTPError) else err.__cause__
+    response = getattr(getattr(source, "error", source), "response", None)
+    try:
+        return float(response.headers["Retry-After"])
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return default
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
 import datetime
+from functools import lru_cache, partial
+import heapq
 import logging
 from numbers import Number
-from zoneinfo import ZoneInfo
+from operator import itemgetter
+from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -14,7 +19,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_ENTITY_ID, CONF_ID, UnitOfLength
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import IntegrationError
 from homeassistant.helpers import entity_platform
 from homeassistant.helpers.entity import DeviceInfo
@@ -28,6 +33,7 @@ from .const import (
     DATA_COORDINATOR,
     DOMAIN as GARMIN_DOMAIN,
     GARMIN_ENTITY_LIST,
+    GEAR_DEFAULTS_CONCURRENCY,
     GEAR_ICONS,
     Gear,
     ServiceSetting,
@@ -35,19 +41,99 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entities read the shared coordinator data, so their updates need no serialization
+PARALLEL_UPDATES = 0
+
+_BADGE_EARNED_DATE = itemgetter("badgeEarnedDate")
+
+# Entity service schemas, see services.yaml
+SET_ACTIVE_GEAR_SCHEMA = {
+    vol.Required(ATTR_ENTITY_ID): str,
+    vol.Required("activity_type"): str,
+    vol.Required("setting"): str,
+}
+
+ADD_BODY_COMPOSITION_SCHEMA = {
+    vol.Required(ATTR_ENTITY_ID): str,
+    vol.Optional("timestamp"): str,
+    vol.Required("weight"): vol.Coerce(float),
+    vol.Optional("percent_fat"): vol.Coerce(float),
+    vol.Optional("percent_hydration"): vol.Coerce(float),
+    vol.Optional("visceral_fat_mass"): vol.Coerce(float),
+    vol.Optional("bone_mass"): vol.Coerce(float),
+    vol.Optional("muscle_mass"): vol.Coerce(float),
+    vol.Optional("basal_met"): vol.Coerce(float),
+    vol.Optional("active_met"): vol.Coerce(float),
+    vol.Optional("physique_rating"): vol.Coerce(float),
+    vol.Optional("metabolic_age"): vol.Coerce(float),
+    vol.Optional("visceral_fat_rating"): vol.Coerce(float),
+    vol.Optional("bmi"): vol.Coerce(float),
+}
+
+ADD_BLOOD_PRESSURE_SCHEMA = {
+    vol.Required(ATTR_ENTITY_ID): str,
+    vol.Optional("timestamp"): str,
+    vol.Required("systolic"): int,
+    vol.Required("diastolic"): int,
+    vol.Required("pulse"): int,
+    vol.Optional("notes"): str,
+}
+
+# State conversions of the sensor types that do not report their raw value
+_VALUE_FNS: dict[str, Callable[[Any], Any]] = {
+    "lastActivities": len,
+    "badges": len,
+    "lastActivity": lambda value: value.get("activityName"),
+    "hrvStatus": lambda value: value["status"].capitalize(),
+    "nextAlarm": lambda value: value[0] if value else None,
+    "stressQualifier": str.capitalize,
+}
+
+
+def _minutes(value: float) -> float:
+    """Convert seconds to whole minutes."""
+    return round(value // 60, 2)
+
+
+def _kilograms(value: float) -> float:
+    """Convert grams to kilograms."""
+    return round(value / 1000, 2)
+
+
+def _value_fn(sensor_type: str) -> Callable[[Any], Any] | None:
+    """Return the state conversion of a sensor type, resolved once per sensor."""
+    if sensor_type in _VALUE_FNS:
+        return _VALUE_FNS[sensor_type]
+    if "Duration" in sensor_type or "Seconds" in sensor_type:
+        return _minutes
+    if "Mass" in sensor_type or sensor_type == "weight":
+        return _kilograms
+    return None
+
+
+@lru_cache(maxsize=256)
+def _parse_timestamp(value: str, tz: datetime.tzinfo) -> datetime.datetime:
+    """Parse a Garmin Connect timestamp, assuming the given time zone when it has no offset."""
+    timestamp = datetime.datetime.fromisoformat(value)
+    return timestamp if timestamp.tzinfo is not None else timestamp.replace(tzinfo=tz)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:
     """Set up Garmin Connect sensor based on a config entry."""
     coordinator: DataUpdateCoordinator = hass.data[GARMIN_DOMAIN][entry.entry_id][DATA_COORDINATOR]
     unique_id = entry.data[CONF_ID]
+    # All sensors of an entry belong to the same device and share its info
+    device_info = DeviceInfo(
+        identifiers={(GARMIN_DOMAIN, unique_id)},
+        name="Garmin Connect",
+        manufacturer="Garmin Connect",
+    )
 
-    entities = []
-    for (
-        sensor_type,
-        (name, unit, icon, device_class, state_class, enabled_by_default),
-    ) in GARMIN_ENTITY_LIST.items():
-        _LOGGER.debug(
-            "Registering entity: %s, %s, %s, %s, %s, %s, %s",
+    entities = [
+        GarminConnectSensor(
+            coordinator,
+            unique_id,
+            device_info,
             sensor_type,
             name,
             unit,
@@ -56,111 +142,107 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
             state_class,
             enabled_by_default,
         )
-        entities.append(
-            GarminConnectSensor(
-                coordinator,
-                unique_id,
-                sensor_type,
-                name,
-                unit,
-                icon,
-                device_class,
-                state_class,
-                enabled_by_default,
-            )
+        for sensor_type, (
+            name,
+            unit,
+            icon,
+            device_class,
+            state_class,
+            enabled_by_default,
+        ) in GARMIN_ENTITY_LIST.items()
+    ]
+    gear_entities = [
+        GarminConnectGearSensor(
+            coordinator,
+            unique_id,
+            device_info,
+            gear_item["gearTypeName"],
+            gear_item["displayName"],
+            UnitOfLength.KILOMETERS,
+            GEAR_ICONS.get(gear_item["gearTypeName"], "mdi:shoe-print"),
+            gear_item[Gear.UUID],
+            SensorDeviceClass.DISTANCE,
+            SensorStateClass.TOTAL,
+            True,
         )
-    if "gear" in coordinator.data:
-        for gear_item in coordinator.data["gear"]:
-            name = gear_item["displayName"]
-            sensor_type = gear_item["gearTypeName"]
-            uuid = gear_item[Gear.UUID]
-            unit = UnitOfLength.KILOMETERS
-            icon = GEAR_ICONS.get(sensor_type, "mdi:shoe-print")
-            device_class = SensorDeviceClass.DISTANCE
-            state_class = SensorStateClass.TOTAL
-            enabled_by_default = True
-
-            _LOGGER.debug(
-                "Registering entity: %s, %s, %s, %s, %s, %s, %s, %s",
-                sensor_type,
-                name,
-                unit,
-                icon,
-                uuid,
-                device_class,
-                state_class,
-                enabled_by_default,
-            )
-            entities.append(
-                GarminConnectGearSensor(
-                    coordinator,
-                    unique_id,
-                    sensor_type,
-                    name,
-                    unit,
-                    icon,
-                    uuid,
-                    device_class,
-                    state_class,
-                    enabled_by_default,
-                )
-            )
+        for gear_item in coordinator.data.get("gear", ())
+    ]
+    _LOGGER.debug("Registering %s sensors and %s gear sensors", len(entities), len(gear_entities))
+    entities.extend(gear_entities)
 
     async_add_entities(entities)
+
     platform = entity_platform.async_get_current_platform()
 
     platform.async_register_entity_service(
         "set_active_gear",
-        {
-            vol.Required(ATTR_ENTITY_ID): str,
-            vol.Required("activity_type"): str,
-            vol.Required("setting"): str,
-        },
+        SET_ACTIVE_GEAR_SCHEMA,
         "set_active_gear",
     )
 
     platform.async_register_entity_service(
         "add_body_composition",
-        {
-            vol.Required(ATTR_ENTITY_ID): str,
-            vol.Optional("timestamp"): str,
-            vol.Required("weight"): vol.Coerce(float),
-            vol.Optional("percent_fat"): vol.Coerce(float),
-            vol.Optional("percent_hydration"): vol.Coerce(float),
-            vol.Optional("visceral_fat_mass"): vol.Coerce(float),
-            vol.Optional("bone_mass"): vol.Coerce(float),
-            vol.Optional("muscle_mass"): vol.Coerce(float),
-            vol.Optional("basal_met"): vol.Coerce(float),
-            vol.Optional("active_met"): vol.Coerce(float),
-            vol.Optional("physique_rating"): vol.Coerce(float),
-            vol.Optional("metabolic_age"): vol.Coerce(float),
-            vol.Optional("visceral_fat_rating"): vol.Coerce(float),
-            vol.Optional("bmi"): vol.Coerce(float),
-        },
+        ADD_BODY_COMPOSITION_SCHEMA,
         "add_body_composition",
     )
 
     platform.async_register_entity_service(
         "add_blood_pressure",
-        {
-            vol.Required(ATTR_ENTITY_ID): str,
-            vol.Optional("timestamp"): str,
-            vol.Required("systolic"): int,
-            vol.Required("diastolic"): int,
-            vol.Required("pulse"): int,
-            vol.Optional("notes"): str,
-        },
+        ADD_BLOOD_PRESSURE_SCHEMA,
         "add_blood_pressure",
     )
 
 
-class GarminConnectSensor(CoordinatorEntity, SensorEntity):
+class GarminConnectEntity(CoordinatorEntity, SensorEntity):
+    """Base class for Garmin Connect sensors that skip unchanged state writes."""
+
+    # The entity base classes keep their own __dict__; slots cover the attributes added here
+    __slots__ = ("_attributes_cache", "_written_state")
+
+    def __init__(self, coordinator) -> None:
+        """Initialize the attribute memo and the last written state."""
+        super().__init__(coordinator)
+        self._attributes_cache: tuple[dict | None, dict] | None = None
+        self._written_state: tuple | None = None
+
+    def _attributes(self) -> dict:
+        """Build the attributes from the coordinator data, none unless overridden."""
+        return {}
+
+    def _cached_attributes(self):
+        """Return the attributes, built once per coordinator payload."""
+        data = self.coordinator.data
+        if self._attributes_cache is None or self._attributes_cache[0] is not data:
+            self._attributes_cache = (data, self._attributes())
+        return self._attributes_cache[1]
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when it differs from the last written one."""
+        state = (self.available, self.native_value, self.extra_state_attributes)
+        if state != self._written_state:
+            self._written_state = state
+            self.async_write_ha_state()
+
+
+class GarminConnectSensor(GarminConnectEntity):
     """Representation of a Garmin Connect Sensor."""
 
+    __slots__ = (
+        "_device_class",
+        "_enabled_default",
+        "_state_class",
+        "_type",
+        "_unique_id",
+        "_value_cache",
+        "_value_fn",
+    )
+
     def __init__(
         self,
         coordinator,
         unique_id,
+        device_info: DeviceInfo,
         sensor_type,
         name,
         unit,
@@ -177,6 +259,7 @@ class GarminConnectSensor(CoordinatorEntity, SensorEntity):
         self._device_class = device_class
         self._state_class = state_class
         self._enabled_default = enabled_default
+        self._value_fn = _value_fn(sensor_type)
 
         self._attr_name = name
         self._attr_device_class = self._device_class
@@ -184,10 +267,25 @@ class GarminConnectSensor(CoordinatorEntity, SensorEntity):
         self._attr_native_unit_of_measurement = unit
         self._attr_unique_id = f"{self._unique_id}_{self._type}"
         self._attr_state_class = state_class
+        self._attr_device_info = device_info
+        self._value_cache: tuple[dict | None, Any] | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Register the sensor type so the coordinator fetches its data."""
+        await super().async_added_to_hass()
+        self.coordinator.enabled_types.add(self._type)
+        self.async_on_remove(partial(self.coordinator.enabled_types.discard, self._type))
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
+        data = self.coordinator.data
+        if self._value_cache is None or self._value_cache[0] is not data:
+            self._value_cache = (data, self._value())
+        return self._value_cache[1]
+
+    def _value(self):
+        """Compute the state from the coordinator data."""
         if not self.coordinator.data:
             return None
 
@@ -195,38 +293,12 @@ class GarminConnectSensor(CoordinatorEntity, SensorEntity):
         if value is None:
             return None
 
-        if self._type == "lastActivities" or self._type == "badges":
-            value = len(self.coordinator.data[self._type])
-
-        if self._type == "lastActivity":
-            value = self.coordinator.data[self._type]["activityName"]
-
-        elif self._type == "hrvStatus":
-            value = self.coordinator.data[self._type]["status"].capitalize()
-
-        elif "Duration" in self._type or "Seconds" in self._type:
-            value = round(value // 60, 2)
-
-        elif "Mass" in self._type or self._type == "weight":
-            value = round(value / 1000, 2)
-
-        elif self._type == "nextAlarm":
-            active_alarms = self.coordinator.data[self._type]
-            _LOGGER.debug("Active alarms: %s", active_alarms)
-            if active_alarms:
-                _LOGGER.debug("Next alarm: %s", active_alarms[0])
-                value = active_alarms[0]
-            else:
-                value = None
-
-        elif self._type == "stressQualifier":
-            value = value.capitalize()
+        if self._value_fn is not None:
+            value = self._value_fn(value)
 
         if self._device_class == SensorDeviceClass.TIMESTAMP:
             if value:
-                value = datetime.datetime.fromisoformat(value).replace(
-                    tzinfo=ZoneInfo(self.coordinator.time_zone)
-                )
+                value = _parse_timestamp(value, self.coordinator.tz)
         return round(value, 2) if isinstance(value, Number) else value
 
     @property
@@ -235,40 +307,35 @@ class GarminConnectSensor(CoordinatorEntity, SensorEntity):
         if not self.coordinator.data:
             return {}
 
+        return self._cached_attributes()
+
+    def _attributes(self):
+        """Build the attributes from the coordinator data."""
         attributes = {
             "last_synced": self.coordinator.data["lastSyncTimestampGMT"],
         }
 
         if self._type == "lastActivities":
-            attributes["last_activities"] = self.coordinator.data[self._type]
+            attributes["last_activities"] = self.coordinator.last_activities
 
         if self._type == "lastActivity":
-            attributes = {**attributes, **self.coordinator.data[self._type]}
+            attributes.update(self.coordinator.data[self._type])
 
         # Only show the last 10 badges for performance reasons
         if self._type == "badges":
             badges = self.coordinator.data.get(self._type, [])
-            sorted_badges = sorted(badges, key=lambda x: x["badgeEarnedDate"])
-            attributes["badges"] = sorted_badges[-10:]
+            latest_badges = heapq.nlargest(10, badges, key=_BADGE_EARNED_DATE)
+            attributes["badges"] = latest_badges[::-1]
 
         if self._type == "nextAlarm":
             attributes["next_alarms"] = self.coordinator.data[self._type]
 
         if self._type == "hrvStatus":
-            attributes = {**attributes, **self.coordinator.data[self._type]}
-            del attributes["status"]
+            attributes.update(self.coordinator.data[self._type])
+            attributes.pop("status", None)
 
         return attributes
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return {
-            "identifiers": {(GARMIN_DOMAIN, self._unique_id)},
-            "name": "Garmin Connect",
-            "manufacturer": "Garmin Connect",
-        }
-
     @property
     def entity_registry_enabled_default(self) -> bool:
         """Return if the entity should be enabled when first added to the entity registry."""
@@ -277,7 +344,9 @@ class GarminConnectSensor(CoordinatorEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return super().available and self.coordinator.data and self._type in self.coordinator.data
+        return bool(
+            super().available and self.coordinator.data and self._type in self.coordinator.data
+        )
 
     async def add_body_composition(self, **kwargs):
         """Handle the service call to add body composition."""
@@ -295,12 +364,8 @@ class GarminConnectSensor(CoordinatorEntity, SensorEntity):
         visceral_fat_rating = kwargs.get("visceral_fat_rating")
         bmi = kwargs.get("bmi")
 
-        """Check for login."""
-        if not await self.coordinator.async_login():
-            raise IntegrationError("Failed to login to Garmin Connect, unable to update")
-
         """Record a weigh in/body composition."""
-        await self.hass.async_add_executor_job(
+        await self.coordinator.async_call(
             self.coordinator.api.add_body_composition,
             timestamp,
             weight,
@@ -325,23 +390,29 @@ class GarminConnectSensor(CoordinatorEntity, SensorEntity):
         pulse = kwargs.get("pulse")
         notes = kwargs.get("notes")
 
-        """Check for login."""
-        if not await self.coordinator.async_login():
-            raise IntegrationError("Failed to login to Garmin Connect, unable to update")
-
         """Record a blood pressure measurement."""
-        await self.hass.async_add_executor_job(
+        await self.coordinator.async_call(
             self.coordinator.api.set_blood_pressure, systolic, diastolic, pulse, timestamp, notes
         )
 
 
-class GarminConnectGearSensor(CoordinatorEntity, SensorEntity):
+class GarminConnectGearSensor(GarminConnectEntity):
     """Representation of a Garmin Connect Gear Sensor."""
 
+    __slots__ = (
+        "_device_class",
+        "_enabled_default",
+        "_state_class",
+        "_type",
+        "_unique_id",
+        "_uuid",
+    )
+
     def __init__(
         self,
         coordinator,
         unique_id,
+        device_info: DeviceInfo,
         sensor_type,
         name,
         unit,
@@ -367,6 +438,7 @@ class GarminConnectGearSensor(CoordinatorEntity, SensorEntity):
         self._attr_native_unit_of_measurement = unit
         self._attr_unique_id = f"{self._unique_id}_{self._uuid}"
         self._attr_state_class = self._state_class
+        self._attr_device_info = device_info
 
     @property
     def uuid(self):
@@ -376,22 +448,20 @@ class GarminConnectGearSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        if not self.coordinator.data or not self._stats():
+        if not self.coordinator.data or not (stats := self._stats()):
             return None
 
-        value = self._stats()["totalDistance"]
+        value = stats["totalDistance"]
         return round(value / 1000, 2)
 
     @property
     def extra_state_attributes(self):
         """Return attributes for sensor."""
-        gear = self._gear()
-        stats = self._stats()
-        gear_defaults = self._gear_defaults()
-        activity_types = self.coordinator.data["activityTypes"]
-        default_for_activity = self._activity_names_for_gear_defaults(gear_defaults, activity_types)
+        return self._cached_attributes()
 
-        if not self.coordinator.data or not gear or not stats:
+    def _attributes(self):
+        """Build the attributes from the coordinator data."""
+        if not self.coordinator.data or not (gear := self._gear()) or not (stats := self._stats()):
             return {}
 
         attributes = {
@@ -408,26 +478,12 @@ class GarminConnectGearSensor(CoordinatorEntity, SensorEntity):
             "maximum_meters": gear["maximumMeters"],
         }
 
-        attributes["default_for_activity"] = (
-            ", ".join(default_for_activity) if default_for_activity else "None"
+        attributes["default_for_activity"] = self.coordinator.default_activities_by_uuid.get(
+            self._uuid, "None"
         )
 
         return attributes
 
-    def _activity_names_for_gear_defaults(self, gear_defaults, activity_types):
-        """Get activity names for gear defaults."""
-        activity_type_ids = [d["activityTypePk"] for d in gear_defaults]
-        return [a["typeKey"] for a in activity_types if a["typeId"] in activity_type_ids]
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return {
-            "identifiers": {(GARMIN_DOMAIN, self._unique_id)},
-            "name": "Garmin Connect",
-            "manufacturer": "Garmin Connect",
-        }
-
     @property
     def entity_registry_enabled_default(self) -> bool:
         """Return if the entity should be enabled when first added to the entity registry."""
@@ -436,71 +492,54 @@ class GarminConnectGearSensor(CoordinatorEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return super().available and self.coordinator.data and self._gear()
+        return super().available and self._uuid in self.coordinator.gear_by_uuid
 
     def _stats(self):
         """Get gear statistics from garmin"""
-        for gear_stats_item in self.coordinator.data["gearStats"]:
-            if gear_stats_item[Gear.UUID] == self._uuid:
-                return gear_stats_item
+        return self.coordinator.gear_stats_by_uuid.get(self._uuid)
 
     def _gear(self):
         """Get gear from garmin"""
-        for gear_item in self.coordinator.data["gear"]:
-            if gear_item[Gear.UUID] == self._uuid:
-                return gear_item
-
-    def _gear_defaults(self):
-        """Get gear defaults"""
-        return list(
-            filter(
-                lambda d: d[Gear.UUID] == self.uuid and d["defaultGear"] is True,
-                self.coordinator.data["gearDefaults"],
-            )
-        )
+        return self.coordinator.gear_by_uuid.get(self._uuid)
 
     async def set_active_gear(self, **kwargs):
         """Handle the service call to set active gear."""
         activity_type = kwargs.get("activity_type")
         setting = kwargs.get("setting")
 
-        """Check for login."""
-        if not await self.coordinator.async_login():
-            raise IntegrationError("Failed to login to Garmin Connect, unable to update")
-
         """Update Garmin Gear settings."""
-        activity_type_id = next(
-            filter(
-                lambda a: a[Gear.TYPE_KEY] == activity_type,
-                self.coordinator.data["activityTypes"],
-            )
-        )[Gear.TYPE_ID]
+        activity_type_id = self.coordinator.activity_type_ids.get(activity_type)
+        if activity_type_id is None:
+            raise IntegrationError(f"Unknown Garmin Connect activity type: {activity_type}")
         if setting != ServiceSetting.ONLY_THIS_AS_DEFAULT:
-            await self.hass.async_add_executor_job(
+            await self.coordinator.async_call(
                 self.coordinator.api.set_gear_default,
                 activity_type_id,
                 self._uuid,
                 setting == ServiceSetting.DEFAULT,
             )
         else:
-            old_default_state = await self.hass.async_add_executor_job(
-                self.coordinator.api.get_gear_defaults, self.coordinator.data[Gear.USERPROFILE_ID]
-            )
-            to_deactivate = list(
-                filter(
-                    lambda o: o[Gear.ACTIVITY_TYPE_PK] == activity_type_id
-                    and o[Gear.UUID] != self._uuid,
-                    old_default_state,
-                )
+            old_default_state = await self.coordinator.async_get_gear_defaults()
+            to_deactivate = [
+                default
+                for default in old_default_state
+                if default[Gear.ACTIVITY_TYPE_PK] == activity_type_id
+                and default[Gear.UUID] != self._uuid
+            ]
+
+            semaphore = asyncio.Semaphore(GEAR_DEFAULTS_CONCURRENCY)
+
+            async def _async_deactivate(uuid: str) -> None:
+                async with semaphore:
+                    await self.coordinator.async_call(
+                        self.coordinator.api.set_gear_default, activity_type_id, uuid, False
+                    )
+
+            await asyncio.gather(
+                *(_async_deactivate(active_gear[Gear.UUID]) for active_gear in to_deactivate)
             )
-
-            for active_gear in to_deactivate:
-                await self.hass.async_add_executor_job(
-                    self.coordinator.api.set_gear_default,
-                    activity_type_id,
-                    active_gear[Gear.UUID],
-                    False,
-                )
-            await self.hass.async_add_executor_job(
+            await self.coordinator.async_call(
                 self.coordinator.api.set_gear_default, activity_type_id, self._uuid, True
             )
+
+        self.coordinator.invalidate_cache("gear_defaults")